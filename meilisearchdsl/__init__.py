@@ -3,3 +3,4 @@ from .query import *
 from .index import *
 from .client import *
 from .index_query import *
+from .aindex import *
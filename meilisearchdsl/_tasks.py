@@ -0,0 +1,114 @@
+# pylint: disable=W0719
+"""Task-polling helpers shared by the sync and async wrappers.
+
+One backoff schedule and one poll loop serve MeiliClient, MeiliIndex and
+AsyncMeiliIndex, so pacing changes happen in a single place.
+"""
+import asyncio
+from time import monotonic, sleep
+from typing import Any, Callable, Iterator, Optional
+
+# Poll delays in seconds, doubling up to a 200ms cap; the last value is
+# repeated until the caller's timeout.
+POLL_BACKOFF = (0.005, 0.01, 0.02, 0.04, 0.08, 0.15, 0.2)
+
+
+def backoff_delays() -> Iterator[float]:
+    """Yield the backoff schedule, then repeat its last delay forever."""
+    yield from POLL_BACKOFF
+    while True:
+        yield POLL_BACKOFF[-1]
+
+
+def resolve_task(task: dict) -> Optional[dict]:
+    """Return a finished task, raise on a failed one, else return None."""
+    if task["status"] == "succeeded":
+        return task
+    if task["status"] == "failed":
+        raise Exception(
+            f"Task '{task['type']}' failed: ",
+            task["uid"],
+            task["error"],
+            task["duration"],
+        )
+    return None
+
+
+def report_timeout(subject: str, timeout_seconds: int) -> None:
+    """Print the standard task-timeout notice."""
+    print(subject, f"timed out after {timeout_seconds} seconds")
+
+
+def poll_tasks(
+    get_tasks: Callable[[dict], Any], uids: Any, timeout_seconds: int
+) -> dict:
+    """Poll `get_tasks` for several uids at once until all finish.
+
+    One request per iteration covers every still-pending uid: the filter
+    is passed as strings (the SDK joins list params with ",".join) and
+    `limit` is sized to it, since the server pages to 20 results by
+    default. Raises if any task failed; returns a mapping of uid to
+    final payload for the tasks that finished in time.
+    """
+    pending = set(uids)
+    completed: dict = {}
+    deadline = monotonic() + timeout_seconds
+    delays = backoff_delays()
+    while pending and monotonic() < deadline:
+        response = get_tasks(
+            {
+                "uids": [str(uid) for uid in sorted(pending)],
+                "limit": len(pending),
+            }
+        )
+        results = (
+            response["results"] if isinstance(response, dict) else response.results
+        )
+        for task in results:
+            uid = task["uid"] if isinstance(task, dict) else task.uid
+            status = task["status"] if isinstance(task, dict) else task.status
+            if status == "failed":
+                raise Exception(
+                    "Task failed: ",
+                    uid,
+                    task["error"] if isinstance(task, dict) else task.error,
+                )
+            if status not in ("enqueued", "processing"):
+                completed[uid] = task
+        pending -= completed.keys()
+        if not pending:
+            break
+        sleep(next(delays))
+    if pending:
+        report_timeout(f"Tasks {sorted(pending)}", timeout_seconds)
+    return completed
+
+
+def poll_task(
+    fetch: Callable[[], dict], label: str, timeout_seconds: int
+) -> Optional[dict]:
+    """Poll `fetch` with backoff until the task finishes or times out."""
+    deadline = monotonic() + timeout_seconds
+    delays = backoff_delays()
+    while monotonic() < deadline:
+        done = resolve_task(fetch())
+        if done is not None:
+            return done
+        sleep(next(delays))
+    report_timeout(label, timeout_seconds)
+    return None
+
+
+async def apoll_task(
+    fetch: Callable[[], Any], label: str, timeout_seconds: int
+) -> Optional[dict]:
+    """Async twin of `poll_task`; `fetch` returns an awaitable."""
+    deadline = monotonic() + timeout_seconds
+    delays = backoff_delays()
+    while monotonic() < deadline:
+        done = resolve_task(await fetch())
+        if done is not None:
+            return done
+        await asyncio.sleep(next(delays))
+    report_timeout(label, timeout_seconds)
+    return None
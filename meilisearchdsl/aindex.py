@@ -0,0 +1,229 @@
+# pylint: disable=W0719,C0103,import-error
+"""Async Index Module
+
+Provides AsyncMeiliIndex, an `async def` counterpart to MeiliIndex built
+on a persistent `httpx.AsyncClient`. Unlike the synchronous `a*` methods
+on MeiliIndex (which simply skip the task wait), these coroutines issue
+the HTTP calls themselves, so callers can overlap many operations with
+`asyncio.gather`:
+
+```results = await asyncio.gather(
+    index.aupdate_filterable_attributes(["name"]),
+    index.aupdate_ranking_rules(["words", "typo"]),
+)
+```
+
+Requires the optional `httpx` dependency.
+"""
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency
+    httpx = None
+
+from ._tasks import apoll_task
+from .query import Q
+
+__all__ = ["AsyncMeiliIndex"]
+
+
+class AsyncMeiliIndex:
+    """Async MeiliIndex backed by a pooled httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        index_name: str,
+        host: str,
+        master_key: str,
+        timeout_seconds: int = 10,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncMeiliIndex requires the optional 'httpx' package"
+            )
+        self.index_name = index_name
+        self.timeout_seconds = timeout_seconds
+        self._client = httpx.AsyncClient(
+            base_url=host,
+            headers={"Authorization": f"Bearer {master_key}"},
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncMeiliIndex":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aadd_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        primary_key: Optional[str] = None,
+        await_task: bool = True,
+    ) -> Dict[str, Any]:
+        """Add documents to the index."""
+        params = {"primaryKey": primary_key} if primary_key else None
+        return await self._arequest(
+            "POST",
+            f"/indexes/{self.index_name}/documents",
+            json=documents,
+            params=params,
+            await_task=await_task,
+        )
+
+    async def aupdate_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        primary_key: Optional[str] = None,
+        await_task: bool = True,
+    ) -> Dict[str, Any]:
+        """Update documents in the index."""
+        params = {"primaryKey": primary_key} if primary_key else None
+        return await self._arequest(
+            "PUT",
+            f"/indexes/{self.index_name}/documents",
+            json=documents,
+            params=params,
+            await_task=await_task,
+        )
+
+    async def adelete_document(
+        self, document_id: Union[str, int], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Delete one document from the index."""
+        return await self._arequest(
+            "DELETE",
+            f"/indexes/{self.index_name}/documents/{document_id}",
+            await_task=await_task,
+        )
+
+    async def adelete_all_documents(self, await_task: bool = True) -> Dict[str, Any]:
+        """Delete all documents from the index."""
+        return await self._arequest(
+            "DELETE",
+            f"/indexes/{self.index_name}/documents",
+            await_task=await_task,
+        )
+
+    async def aupdate_filterable_attributes(
+        self, attributes: List[str], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Update filterable attributes of the index."""
+        return await self._aupdate_setting(
+            "filterable-attributes", attributes, await_task
+        )
+
+    async def aupdate_searchable_attributes(
+        self, attributes: List[str], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Update searchable attributes of the index."""
+        return await self._aupdate_setting(
+            "searchable-attributes", attributes, await_task
+        )
+
+    async def aupdate_displayed_attributes(
+        self, attributes: List[str], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Update displayed attributes of the index."""
+        return await self._aupdate_setting(
+            "displayed-attributes", attributes, await_task
+        )
+
+    async def aupdate_sortable_attributes(
+        self, attributes: List[str], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Update sortable attributes of the index."""
+        return await self._aupdate_setting(
+            "sortable-attributes", attributes, await_task
+        )
+
+    async def aupdate_ranking_rules(
+        self, rules: List[str], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Update ranking rules of the index."""
+        return await self._aupdate_setting("ranking-rules", rules, await_task)
+
+    async def aupdate_settings(
+        self, settings: Dict[str, Any], await_task: bool = True
+    ) -> Dict[str, Any]:
+        """Update settings of the index."""
+        return await self._arequest(
+            "PATCH",
+            f"/indexes/{self.index_name}/settings",
+            json=settings,
+            await_task=await_task,
+        )
+
+    async def aget_settings(self) -> Dict[str, Any]:
+        """Get settings of the index."""
+        response = await self._client.get(f"/indexes/{self.index_name}/settings")
+        response.raise_for_status()
+        return response.json()
+
+    async def asearch(
+        self,
+        search_string: str,
+        q: Optional[Q] = None,
+        opt_params: Union[Dict[str, Any], None] = None,
+    ) -> Dict[str, Any]:
+        """Search for documents in the index."""
+        body: Dict[str, Any] = {"q": search_string}
+        if q is not None:
+            assert isinstance(q, Q), "q must be a Q object"
+            body["filter"] = q.to_query_string()
+        if opt_params is not None:
+            assert isinstance(opt_params, dict), "opt_params must be a dictionary"
+            body.update(opt_params)
+        response = await self._client.post(
+            f"/indexes/{self.index_name}/search", json=body
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _aupdate_setting(
+        self, setting_path: str, body: Any, await_task: bool
+    ) -> Dict[str, Any]:
+        """Update one settings sub-resource of the index."""
+        return await self._arequest(
+            "PUT",
+            f"/indexes/{self.index_name}/settings/{setting_path}",
+            json=body,
+            await_task=await_task,
+        )
+
+    async def _arequest(
+        self,
+        method: str,
+        path: str,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        await_task: bool = True,
+    ) -> Dict[str, Any]:
+        """Issue one HTTP request and optionally await the resulting task."""
+        response = await self._client.request(method, path, json=json, params=params)
+        response.raise_for_status()
+        task_info = response.json()
+        if not await_task:
+            return task_info
+        return await self._await_running_task(task_info)
+
+    async def _await_running_task(
+        self, task_info: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for a task to complete without blocking the event loop."""
+        task_uid = task_info.get("taskUid", task_info.get("uid"))
+
+        async def fetch() -> Dict[str, Any]:
+            response = await self._client.get(f"/tasks/{task_uid}")
+            response.raise_for_status()
+            return response.json()
+
+        return await apoll_task(
+            fetch,
+            f"Task '{task_info.get('type')}:{task_uid}'",
+            self.timeout_seconds,
+        )
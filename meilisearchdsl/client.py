@@ -6,9 +6,33 @@ provides a simple interface to delete indexes and documents from them.
 from typing import Dict, List
 
 from meilisearch import Client
+from meilisearch.errors import MeilisearchApiError
 from meilisearch.index import Index
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 
-from .index import MeiliIndex
+from ._tasks import poll_tasks
+from .index import _INDEX_HANDLES, MeiliIndex
+
+_NO_CLIENT_ERROR = "No Meilisearch client"
+
+
+def _make_pooled_session() -> Session:
+    """Build a keep-alive Session with a tuned connection pool.
+
+    Reusing one pooled connection across all calls avoids paying a TCP +
+    TLS handshake per request, which matters most for the task-polling
+    loop and multi-index workflows.
+    """
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class MeiliClient:
@@ -17,75 +41,97 @@ class MeiliClient:
     provides a simple interface to delete indexes and documents from them.
     """
 
-    client: Client
-    config: dict
-    indexes: dict = {}
+    __slots__ = ("client", "config", "indexes")
 
     def __init__(self, host: str, master_key: str):
         self.config = {"host": host, "master_key": master_key}
         self.client = Client(host, master_key)
+        # Guarantee the invariant here once, instead of re-checking (and
+        # re-fetching) the client at the top of every public method.
+        if self.client is None:
+            raise RuntimeError(_NO_CLIENT_ERROR)
         self.indexes = {}
+        self._install_session(self.client)
+
+    @staticmethod
+    def _install_session(client: Client) -> None:
+        """Route the client's HTTP calls through a pooled keep-alive Session.
+
+        The SDK's `HttpRequests` verbs call `send_request` with the
+        module-level `requests.get`/`requests.post`/... functions, which
+        open a fresh connection per call. Wrapping `send_request` to swap
+        each of those for the same-named bound method of one pooled
+        Session (they take identical arguments) restores keep-alive
+        without touching the rest of the SDK.
+        """
+        http = getattr(client, "http", None)
+        if http is None or not hasattr(http, "send_request"):
+            return
+        session = _make_pooled_session()
+        inner = http.send_request
+
+        def send_request(http_method, path, *args, **kwargs):
+            bound = getattr(session, http_method.__name__, http_method)
+            return inner(bound, path, *args, **kwargs)
+
+        http.send_request = send_request
 
     def get_client(self) -> Client:
-        """Get the MeiliSearch client. If it doesn't exist, create it."""
-        if self.client is None:
-            assert self.config is not None, "MeiliClient config not set"
-            assert "host" in self.config, "MeiliClient config missing host"
-            assert "master_key" in self.config, "MeiliClient config missing master_key"
-            self.client = Client(
-                self.config["host"], self.config["master_key"])
+        """Get the MeiliSearch client (always set since __init__)."""
         return self.client
 
     def get_index(self, index_name: str, primary_key: str) -> MeiliIndex:
         """Get an index by name. If it doesn't exist, create it."""
-        self.client = self.get_client()
-        assert self.client is not None, ModuleNotFoundError(
-            "No Meilisearch client")
-
-        if index_name not in self.indexes:
-            self.indexes[index_name] = MeiliIndex(index_name, self.client, primary_key)
-        return self.indexes[index_name]
+        cache_key = (index_name, primary_key)
+        if cache_key not in self.indexes:
+            self.indexes[cache_key] = MeiliIndex(index_name, self.client, primary_key)
+        return self.indexes[cache_key]
 
     def delete_index(self, index_name: str):
         """Delete an index by name."""
-        self.client = self.get_client()
-        assert self.client is not None, ModuleNotFoundError(
-            "No Meilisearch client")
-
-        if index_name in self.indexes:
-            self.indexes[index_name].delete()
-            del self.indexes[index_name]
-        else:
+        try:
             self.client.delete_index(index_name)
+        except MeilisearchApiError as error:
+            # Only a missing index is tolerable; an auth or uid error
+            # must not masquerade as a successful delete.
+            if getattr(error, "code", None) != "index_not_found":
+                raise
+        for key in [key for key in self.indexes if key[0] == index_name]:
+            del self.indexes[key]
+        # Evict shared handles too: a live wrapper elsewhere would keep
+        # them alive, and a stale handle bypasses get-or-create.
+        for key in [key for key in _INDEX_HANDLES if key[1] == index_name]:
+            del _INDEX_HANDLES[key]
+
+    def await_tasks(
+        self, uids: List[int], timeout_seconds: int = 60
+    ) -> Dict[int, dict]:
+        """Wait for several tasks to finish with one poll per iteration.
+
+        Instead of running one polling loop per task (N HTTP requests per
+        interval), every iteration issues a single `get_tasks` call
+        filtered to the still-pending uids and discards the ones that
+        come back finished. Raises if any task failed; returns a mapping
+        of uid to final task payload for the tasks that finished in time.
+        """
+        if not uids:
+            return {}
+        # An empty uids filter would match every historical task, hence
+        # the early return above.
+        return poll_tasks(self.client.get_tasks, uids, timeout_seconds)
 
     def get_indexes(self) -> Dict[str, List[Index]]:
         """Get a list of all indexes."""
-        self.client = self.get_client()
-        assert self.client is not None, ModuleNotFoundError(
-            "No Meilisearch client")
-
         return self.client.get_indexes()
 
     def get_health(self) -> dict:
         """Get the health of the MeiliSearch instance."""
-        self.client = self.get_client()
-        assert self.client is not None, ModuleNotFoundError(
-            "No Meilisearch client")
-
         return self.client.health()
 
     def get_stats(self) -> dict:
         """Get the stats of the MeiliSearch instance."""
-        self.client = self.get_client()
-        assert self.client is not None, ModuleNotFoundError(
-            "No Meilisearch client")
-
         return self.client.get_all_stats()
 
     def get_version(self) -> dict:
         """Get the version of the MeiliSearch instance."""
-        self.client = self.get_client()
-        assert self.client is not None, ModuleNotFoundError(
-            "No Meilisearch client")
-
         return self.client.get_version()
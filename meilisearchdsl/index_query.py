@@ -1,8 +1,8 @@
-# pylint: disable=R0902
+# pylint: disable=R0902,R0903,W0201,W0212
 """ The module used for building MultiSearch Index Queries. """
-from typing import Dict, List, Optional, Union
+from typing import List, Union
 
-from .query import Q
+from .query import CompiledQ, Q
 
 
 class IndexQuery:
@@ -11,57 +11,98 @@ class IndexQuery:
     MeiliSearch query for use with the multi search endpoint.
     """
 
-    _attributes = {
-        "filter": Optional[Q],
-        "limit": Optional[int],
-        "offset": Optional[int],
-        "hits_per_page": Optional[int],
-        "page": Optional[int],
-        "facets": Optional[List[str]],
-        "attributes_to_retrieve": Optional[List[str]],
-        "attributes_to_crop": Optional[List[str]],
-        "crop_length": Optional[int],
-        "crop_marker": Optional[str],
-        "attributes_to_highlight": Optional[List[str]],
-        "highlight_pre_tag": Optional[str],
-        "highlight_post_tag": Optional[str],
-        "show_matches_position": Optional[bool],
-        "sort": Optional[List[str]],
-        "matching_strategy": Optional[str],
+    _SLOTS = (
+        "filter",
+        "limit",
+        "offset",
+        "hits_per_page",
+        "page",
+        "facets",
+        "attributes_to_retrieve",
+        "attributes_to_crop",
+        "crop_length",
+        "crop_marker",
+        "attributes_to_highlight",
+        "highlight_pre_tag",
+        "highlight_post_tag",
+        "show_matches_position",
+        "sort",
+        "matching_strategy",
+    )
+    _ATTRS = frozenset(_SLOTS)
+    # Attributes holding a Q object that must be rendered to a string.
+    _Q_ATTRS = frozenset({"filter"})
+    # The multi-search endpoint expects camelCase body keys; identity
+    # mappings (filter, limit, ...) are handled by _CAMEL.get(attr, attr).
+    _CAMEL = {
+        "hits_per_page": "hitsPerPage",
+        "attributes_to_retrieve": "attributesToRetrieve",
+        "attributes_to_crop": "attributesToCrop",
+        "crop_length": "cropLength",
+        "crop_marker": "cropMarker",
+        "attributes_to_highlight": "attributesToHighlight",
+        "highlight_pre_tag": "highlightPreTag",
+        "highlight_post_tag": "highlightPostTag",
+        "show_matches_position": "showMatchesPosition",
+        "matching_strategy": "matchingStrategy",
     }
 
+    __slots__ = _SLOTS + ("index_uid", "search_query")
+
     def __init__(self, index_uid: str, search_query: str):
         self.index_uid = index_uid
         self.search_query = search_query
 
         # Initialize attributes to None
-        for attr in self._attributes:
+        for attr in self._SLOTS:
             setattr(self, attr, None)
 
-    def get_dict(self) -> Dict[str, Union[str, int, List[str]]]:
-        """
-        Return a dictionary representation of the query.
-        """
-        return_dict: Dict[str, Union[str, int, List[str]]] = {
-            "indexUid": self.index_uid,
-            "q": self.search_query,
-        }
-        for attr, attr_type in self._attributes.items():
-            value = getattr(self, attr)
-            if value is not None:
-                return_dict[attr] = value if attr_type != Q else value.to_query_string()
-        return return_dict
+    # get_dict is generated below from _SLOTS/_CAMEL; see _compile_get_dict.
 
     def set_attr(self, attr: str, value: Union[str, int, List[str], Q]):
         """
         Set an attribute of the query.
         """
-        if attr not in self._attributes:
+        if attr not in self._ATTRS:
             raise AttributeError(f"Attribute {attr} does not exist.")
         setattr(self, attr, value)
         return self
 
 
+def _compile_get_dict():
+    """Generate an unrolled `IndexQuery.get_dict` at import time.
+
+    The generic version loops over `_SLOTS` with getattr and per-attribute
+    dict probes on every call. Since the slot list and key mapping are
+    fixed at class definition, the loop is unrolled once here into a flat
+    sequence of attribute loads and conditional stores, which is what a
+    hand-written hot-path serializer would look like.
+    """
+    lines = [
+        "def get_dict(self):",
+        '    d = {"indexUid": self.index_uid, "q": self.search_query}',
+    ]
+    for attr in IndexQuery._SLOTS:
+        key = IndexQuery._CAMEL.get(attr, attr)
+        rendered = "v.to_filter()" if attr in IndexQuery._Q_ATTRS else "v"
+        lines.append(f"    v = self.{attr}")
+        lines.append("    if v is not None:")
+        lines.append(f'        d["{key}"] = {rendered}')
+    lines.append("    return d")
+    namespace: dict = {}
+    exec(compile("\n".join(lines), __file__, "exec"), namespace)  # pylint: disable=exec-used
+    get_dict = namespace["get_dict"]
+    get_dict.__qualname__ = "IndexQuery.get_dict"
+    get_dict.__doc__ = (
+        "Return a dictionary representation of the query, using the\n"
+        "        camelCase keys the multi-search endpoint expects."
+    )
+    return get_dict
+
+
+IndexQuery.get_dict = _compile_get_dict()
+
+
 class IndexSearch:
     """The class used for building MultiSearch Index Queries."""
 
@@ -69,87 +110,100 @@ class IndexSearch:
         self,
         index_uid: str,
         search: str,
+        **kwargs: Union[str, int, bool, List[str], Q],
     ):
-        self.index_query = IndexQuery(index_uid, search)
-
-    def filter(self, _filter: Q):
-        """Set the filter for the query."""
-        self.index_query.set_attr("filter", _filter)
+        index_query = IndexQuery(index_uid, search)
+        unknown = kwargs.keys() - IndexQuery._ATTRS
+        if unknown:
+            raise AttributeError(
+                f"Attributes {sorted(unknown)} do not exist."
+            )
+        for attr, value in kwargs.items():
+            setattr(index_query, attr, value)
+        self.index_query = index_query
+
+    def filter(self, _filter: Union[Q, CompiledQ]):
+        """Set the filter for the query.
+
+        Accepts a Q tree or a pre-rendered CompiledQ; both serialize via
+        to_query_string when the request body is built.
+        """
+        self.index_query.filter = _filter
         return self
 
     def limit(self, limit: int):
         """Set the limit for the query."""
-        self.index_query.set_attr("limit", limit)
+        self.index_query.limit = limit
         return self
 
     def offset(self, offset: int):
         """Set the offset for the query."""
-        self.index_query.set_attr("offset", offset)
+        self.index_query.offset = offset
         return self
 
     def hits_per_page(self, hits_per_page: int):
         """Set the hits per page for the query."""
-        self.index_query.set_attr("hits_per_page", hits_per_page)
+        self.index_query.hits_per_page = hits_per_page
         return self
 
     def page(self, page: int):
         """Set the page for the query."""
-        self.index_query.set_attr("page", page)
+        self.index_query.page = page
         return self
 
     def facets(self, facets: List[str]):
         """Set the facets for the query."""
-        self.index_query.set_attr("facets", facets)
+        self.index_query.facets = facets
         return self
 
     def retrieve_attributes(self, attributes_to_retrieve: List[str]):
         """Set the attributes to retrieve for the query."""
-        self.index_query.set_attr("attributes_to_retrieve", attributes_to_retrieve)
+        self.index_query.attributes_to_retrieve = attributes_to_retrieve
         return self
 
     def crop_attributes(self, attributes_to_crop: List[str]):
         """Set the attributes to crop for the query."""
-        self.index_query.set_attr("attributes_to_crop", attributes_to_crop)
+        self.index_query.attributes_to_crop = attributes_to_crop
         return self
 
     def crop_length(self, crop_length: int):
         """Set the crop length for the query."""
-        self.index_query.set_attr("crop_length", crop_length)
+        self.index_query.crop_length = crop_length
         return self
 
     def crop_marker(self, crop_marker: str):
         """Set the crop marker for the query."""
-        self.index_query.set_attr("crop_marker", crop_marker)
+        self.index_query.crop_marker = crop_marker
         return self
 
     def highlight_attributes(self, attributes_to_highlight: List[str]):
         """Set the attributes to highlight for the query."""
-        self.index_query.set_attr("attributes_to_highlight", attributes_to_highlight)
+        self.index_query.attributes_to_highlight = attributes_to_highlight
         return self
 
     def highlight_pre_tag(self, highlight_pre_tag: str):
         """Set the highlight pre tag for the query."""
-        self.index_query.set_attr("highlight_pre_tag", highlight_pre_tag)
+        self.index_query.highlight_pre_tag = highlight_pre_tag
         return self
 
     def highlight_post_tag(self, highlight_post_tag: str):
         """Set the highlight post tag for the query."""
-        self.index_query.set_attr("highlight_post_tag", highlight_post_tag)
+        self.index_query.highlight_post_tag = highlight_post_tag
         return self
 
     def show_matches_position(self, show_matches_position: bool):
         """Set the show matches position for the query."""
-        self.index_query.set_attr("show_matches_position", show_matches_position)
+        self.index_query.show_matches_position = show_matches_position
         return self
 
     def sort(self, sort: List[str]):
         """Set the sort for the query."""
-        self.index_query.set_attr("sort", sort)
+        self.index_query.sort = sort
         return self
 
     def matching_strategy(self, matching_strategy: str):
         """Set the matching strategy for the query."""
-        self.index_query.set_attr("matching_strategy", matching_strategy)
+        self.index_query.matching_strategy = matching_strategy
         return self
 
     def query(self):
@@ -1,4 +1,4 @@
-# pylint: disable=W0719,E1101,C0103,E1131
+# pylint: disable=W0719,C0103,R0902,W0212,E1101,E1131
 """
 Query (Q) Module
 This module provides the Q class, which is designed to help you create 
@@ -28,13 +28,80 @@ q = ~Q(title__eq='The Catcher in the Rye')
 query_string = q.to_query_string()
 ```
 """
+import re
 from enum import Enum
+from functools import lru_cache
+from sys import intern
 from typing import Any, List, Union
 
+# Upper bound on operator-tree depth. Combining is O(1), so the guard
+# exists to reject degenerate programmatic trees up front rather than
+# letting them blow up later in a renderer or on the server.
+MAX_Q_DEPTH = 500
+
+# Tokens the prettifier cares about; everything else passes through one
+# character at a time, matching the old char-machine's behaviour.
+_PRETTIFY_TOKENS = re.compile(r"\(|\)|AND|OR |[^()]")
+
+# Interned operation tokens. _parse_key interns the operation it returns,
+# so the hot comparisons in the render loop are near-pointer checks on
+# shared str objects instead of str-subclass enum __eq__ calls.
+_OP_EQ = intern("eq")
+_OP_IN = intern("in")
+_OP_NOT_IN = intern("nin")
+
+
+class CompiledQ:
+    """A frozen, pre-rendered form of a Q tree.
+
+    Holds just the two serialized forms with no node graph behind them,
+    so a hot filter can be compiled once at module scope and shared:
+    serialization is a plain attribute read and the original tree can be
+    garbage collected.
+    """
+
+    __slots__ = ("filter_str", "list_form")
+
+    def __init__(self, filter_str: str, list_form: list):
+        self.filter_str = filter_str
+        self.list_form = list_form
+
+    def to_query_string(self) -> str:
+        """Returns the pre-rendered MeiliSearch query string."""
+        return self.filter_str
+
+    def to_query_list(self, lvl: int = 0) -> list:  # pylint: disable=W0613
+        """Returns the pre-rendered MeiliSearch query list.
+
+        `lvl` mirrors Q.to_query_list's signature; nesting was already
+        validated when the tree was compiled.
+        """
+        return self.list_form
+
+    def to_filter(self) -> str:
+        """Returns the filter string for a search request body."""
+        return self.filter_str
+
+    def __repr__(self) -> str:
+        return f"CompiledQ({self.filter_str})"
+
 
 class Q:
     """A class for constructing complex query expressions for MeiliSearch."""
 
+    __slots__ = (
+        "conditions",
+        "operator",
+        "negate",
+        "children",
+        "depth",
+        "_cached_qs",
+        "_cached_ql",
+        "_cached_pp",
+        "_cached_ex",
+        "_parsed_conditions",
+    )
+
     class OPERATIONS(str, Enum):
         """A class for defining the available comparison operations."""
 
@@ -78,26 +145,84 @@ class Q:
         op_map[OPERATIONS.EXISTS]: op_map[OPERATIONS.NOT_EXISTS],
         op_map[OPERATIONS.NOT_EXISTS]: op_map[OPERATIONS.EXISTS],
     }
+    # Operation -> already-negated symbol, composed once from the two
+    # tables above so negated leaves resolve in a single dict probe.
+    # (Built with zip/map because class-body comprehensions cannot see
+    # other class attributes.)
+    _NEGATED_OP_MAP = dict(zip(op_map, map(negate_map.get, op_map.values())))
+    # Operator symbols pre-padded with their surrounding spaces, so a
+    # leaf condition is assembled with two concatenations instead of an
+    # f-string interpolation per condition.
+    _OP_PADDED = {symbol: " " + symbol + " " for symbol in negate_map}
+    # Frozen views of the tables above for O(1) membership tests; str-mixin
+    # enum members hash like their values, so both "eq" and OPERATIONS.EQUALS
+    # hit in _OP_VALUES.
+    _OP_VALUES = frozenset(OPERATIONS)
+    # Operators that take no right-hand value.
+    _UNARY_OPS = frozenset(("EXISTS", "NOT EXISTS"))
+    _EXPR_OPS = frozenset(op.value for op in OPERATIONS) | frozenset(
+        negate_map.values()
+    )
 
     def __init__(self, **kwargs) -> None:
-        """Initializes a Q object with the given conditions."""
+        """Initializes a Q object with the given conditions.
+
+        Conditions are parsed and validated here, once: an unknown
+        operation raises ValueError at construction (where the typo is),
+        and the renderers iterate ready-made (field, operation, value)
+        triples instead of re-splitting keys on every call.
+        """
         self.conditions = kwargs
+        parsed = []
+        for key, value in kwargs.items():
+            field, operation = _parse_key(key)
+            if operation not in self._OP_VALUES:
+                raise ValueError(f"Invalid operation {operation}")
+            parsed.append((field, operation, value))
+        self._parsed_conditions = parsed
         self.operator = None
         self.negate = False
         self.children = []
+        self.depth = 0
+        # Rendered-form caches; Q trees are effectively immutable once
+        # combined (the operators return new nodes), so no invalidation
+        # is needed. Each renderer caches independently, so e.g. calling
+        # explain() never pays for (or invalidates) to_query_string().
+        self._cached_qs = None
+        self._cached_ql = None
+        self._cached_pp = None
+        self._cached_ex = None
 
     def __or__(self, other) -> "Q":
         """Returns a new Q object with the OR operator applied to the two Q objects."""
-        new_q = Q()
-        new_q.operator = "OR"
-        new_q.children = [self, other]
-        return new_q
+        return self._combine(other, "OR")
 
     def __and__(self, other) -> "Q":
         """Returns a new Q object with the AND operator applied to the two Q objects."""
+        return self._combine(other, "AND")
+
+    def _combine(self, other, operator: str) -> "Q":
+        """Build the combined node, flattening same-operator operands.
+
+        `a | b | c` used to produce a left-leaning binary tree; absorbing
+        non-negated children that already carry the same operator yields
+        one n-ary node instead, so long chains render flat
+        (`(a) OR (b) OR (c)`) and walk N nodes rather than 2N-1.
+        """
         new_q = Q()
-        new_q.operator = "AND"
-        new_q.children = [self, other]
+        new_q.operator = operator
+        children = []
+        for operand in (self, other):
+            if operand.operator == operator and not operand.negate:
+                children.extend(operand.children)
+            else:
+                children.append(operand)
+        new_q.children = children
+        new_q.depth = max(child.depth for child in children) + 1
+        if new_q.depth > MAX_Q_DEPTH:
+            raise ValueError(
+                f"Q tree exceeds the maximum depth of {MAX_Q_DEPTH}"
+            )
         return new_q
 
     def __invert__(self) -> "Q":
@@ -105,173 +230,223 @@ class Q:
         new_q = Q()
         new_q.negate = not self.negate
         new_q.conditions = self.conditions
+        new_q._parsed_conditions = self._parsed_conditions
         new_q.operator = self.operator
         new_q.children = self.children
+        new_q.depth = self.depth
         return new_q
 
+    def to_filter(self) -> str:
+        """Returns the filter string for a search request body.
+
+        The entry point request builders use for both Q and CompiledQ:
+        it reads the cache directly and only falls back to a render on
+        the first call.
+        """
+        cached = self._cached_qs
+        return cached if cached is not None else self.to_query_string()
+
+    def freeze(self) -> "Q":
+        """Pre-render the string form of the tree.
+
+        Freezing a filter where it is defined (typically module scope)
+        moves the render cost to import time, so the first request that
+        uses it pays nothing. Combining a frozen node stays valid since
+        the combinators never mutate their operands. Returns self, so a
+        definition can freeze inline:
+
+        ```ACTIVE = (Q(status="active") & Q(deleted__exists=False)).freeze()```
+        """
+        self.to_query_string()
+        return self
+
     def _clean_value(self, val) -> Union[str, int, dict, List[Any]]:
-        """Returns a proper (cleaned) representation of the given value."""
-        retval = val
-        if isinstance(val, str):
+        """Returns a proper (cleaned) representation of the given value.
+
+        Dispatches on exact type: IN-list values are overwhelmingly str,
+        bool, int or float, so the common cases are resolved with a
+        single identity check instead of a chain of isinstance calls.
+        """
+        cls = type(val)
+        if cls is str:
             if " " in val:
-                retval = f'"{val}"'
-            else:
-                retval = val
-        elif isinstance(val, bool):
-            retval = str(val).lower()
-        else:
-            retval = str(val)
-        expression_ops = list(self.OPERATIONS.get_values()) + list(
-            self.negate_map.values()
-        )
-        if retval in expression_ops:
-            retval = f'"{retval}"'
-        return retval
+                # Quoting already disambiguates the literal, so the
+                # operator-collision probe is redundant here.
+                return f'"{val}"'
+            return f'"{val}"' if val in self._EXPR_OPS else val
+        if cls is bool:
+            return "true" if val else "false"
+        # Numbers (and other stringified types) can never collide with an
+        # operator keyword, so they skip the membership probe entirely.
+        return str(val)
 
     def __repr__(self) -> str:
         """Returns a string representation of the Q object."""
         return f"Q({self.to_query_string()})"
 
-    def to_query_string(self) -> str:
-        """Returns a MeiliSearch query string representation of the Q object."""
-        if self.operator:
-            left = self.children[0].to_query_string()
-            right = self.children[1].to_query_string()
-            return f"({left}) {self.operator} ({right})"
+    def __eq__(self, other) -> bool:
+        """Two Q objects are equal when they render to the same query string."""
+        if not isinstance(other, Q):
+            return NotImplemented
+        return self.to_query_string() == other.to_query_string()
+
+    def __hash__(self) -> int:
+        """Hash by rendered query string, so identical filters deduplicate
+        (e.g. one shared filter across many IndexSearch objects)."""
+        return hash(self.to_query_string())
+
+    def _render_leaf_conditions(self) -> str:
+        """Render this node's own conditions (no children) to a string.
+
+        Shared by both serializers. The class-level tables and enum
+        members are bound to locals up front, keeping the per-condition
+        loop to local loads and dict probes.
+        """
+        symbol_map = self._NEGATED_OP_MAP if self.negate else self.op_map
+        op_padded = self._OP_PADDED
+        unary_ops = self._UNARY_OPS
+        op_in = _OP_IN
+        op_not_in = _OP_NOT_IN
+        clean_value = self._clean_value
         conditions = []
-        for key, value in self.conditions.items():
-            *fields, operation = (
-                key.split("__") if "__" in key else (key, self.OPERATIONS.EQUALS)
-            )
-            field = ".".join(fields)
-            assert operation in self.OPERATIONS.get_values(), ValueError(
-                f"Invalid operation {operation}"
-            )
-            if operation == self.OPERATIONS.IN:
-                assert isinstance(value, list), ValueError(
-                    f"Value for IN operation must be a list. Got {value}"
+        for field, operation, value in self._parsed_conditions:
+            if operation in (op_in, op_not_in):
+                assert isinstance(value, (list, tuple)), ValueError(
+                    f"Value for {'IN' if operation == op_in else 'NOT_IN'}"
+                    f" operation must be a list. Got {value}"
                 )
-                escaped_values = [self._clean_value(i) for i in value]
-                value = f"[{','.join(escaped_values)}]"
-            elif operation == self.OPERATIONS.NOT_IN:
-                assert isinstance(value, list), ValueError(
-                    f"Value for NOT_IN operation must be a list. Got {value}"
-                )
-                escaped_values = [self._clean_value(i) for i in value]
-                value = f"[{','.join(escaped_values)}]"
-            else:
-                if isinstance(value, str) and " " in value:
-                    value = f'"{value}"'
-            if self.negate:
-                operation = self.negate_map[self.op_map[operation]]
+                # map() drives the cleaning loop in C instead of a
+                # generator frame per element.
+                value = f"[{','.join(map(clean_value, value))}]"
+            elif isinstance(value, str) and " " in value:
+                value = f'"{value}"'
+            symbol = symbol_map[operation]
+            if symbol in unary_ops:
+                conditions.append(field + " " + symbol)
             else:
-                operation = self.op_map[operation]
-            condition = ""
-            if operation in ["EXISTS", "NOT EXISTS"]:
-                condition = f"{field} {operation}"
-            else:
-                condition = f"{field} {operation} {value}"
-            conditions.append(condition)
+                conditions.append(field + op_padded[symbol] + str(value))
         return " AND ".join(conditions)
 
+    def to_query_string(self) -> str:
+        """Returns a MeiliSearch query string representation of the Q object.
+
+        The rendered string is cached on the instance, so repeated
+        serialization of the same tree (paginated searches, shared filter
+        fragments) costs a single attribute lookup. The operator tree is
+        walked with an explicit post-order stack instead of recursion, so
+        deep chains of `|`/`&` cost neither Python frames nor a
+        RecursionError.
+        """
+        if self._cached_qs is not None:
+            return self._cached_qs
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node._cached_qs is not None:
+                continue
+            if not node.operator:
+                node._cached_qs = node._render_leaf_conditions()
+            elif expanded:
+                node._cached_qs = f" {node.operator} ".join(
+                    f"({child._cached_qs})" for child in node.children
+                )
+            else:
+                stack.append((node, True))
+                for child in reversed(node.children):
+                    stack.append((child, False))
+        return self._cached_qs
+
+    def compile(self) -> "CompiledQ":
+        """Render both serialized forms and return them as a CompiledQ."""
+        return CompiledQ(self.to_query_string(), self.to_query_list())
+
     def to_query_list(self, lvl: int = 0) -> list:
-        """Returns a MeiliSearch query list representation of the Q object."""
-        if lvl > 2:
+        """Returns a MeiliSearch query list representation of the Q object.
+
+        The result is cached per node, so re-serializing a shared tree is
+        free. The nesting check compares each node's own height (`depth`)
+        against the levels remaining, so it still runs on every call and
+        a cached subtree cannot smuggle extra levels past it.
+        """
+        if lvl + self.depth > 2:
             raise Exception(
                 "Query nesting too deep, meilisearch only supports 2 levels of nesting"
             )
-        if self.operator:
-            left = self.children[0].to_query_list(lvl + 1)
-            right = self.children[1].to_query_list(lvl + 1)
-            return [left, right]
-        conditions = []
-        for key, value in self.conditions.items():
-            *fields, operation = (
-                key.split("__") if "__" in key else (key, self.OPERATIONS.EQUALS)
-            )
-            field = ".".join(fields)
-            assert (
-                operation in self.OPERATIONS.get_values()
-            ), f"Invalid operation {operation}"
-            if operation == self.OPERATIONS.IN:
-                assert isinstance(
-                    value, list
-                ), f"Value for IN operation must be a list. Got {value}"
-                escaped_values = [self._clean_value(i) for i in value]
-                value = f"[{','.join(escaped_values)}]"
-            elif operation == self.OPERATIONS.NOT_IN:
-                assert isinstance(
-                    value, list
-                ), f"Value for NOT_IN operation must be a list. Got {value}"
-                escaped_values = [self._clean_value(i) for i in value]
-                value = f"[{','.join(escaped_values)}]"
-            else:
-                if isinstance(value, str) and " " in value:
-                    value = f'"{value}"'
-            if self.negate:
-                operation = self.negate_map[self.op_map[operation]]
-            else:
-                operation = self.op_map[operation]
-            if operation in ["EXISTS", "NOT EXISTS"]:
-                condition = f"{field} {operation}"
+        if self._cached_ql is not None:
+            return self._cached_ql
+        stack = [(self, lvl, False)]
+        while stack:
+            node, depth, expanded = stack.pop()
+            if depth + node.depth > 2:
+                raise Exception(
+                    "Query nesting too deep, "
+                    "meilisearch only supports 2 levels of nesting"
+                )
+            if node._cached_ql is not None:
+                continue
+            if not node.operator:
+                node._cached_ql = node._render_leaf_conditions()
+            elif expanded:
+                node._cached_ql = [
+                    child._cached_ql for child in node.children
+                ]
             else:
-                condition = f"{field} {operation} {value}"
-            conditions.append(condition)
-        return " AND ".join(conditions)  # type: ignore
+                stack.append((node, depth, True))
+                for child in reversed(node.children):
+                    stack.append((child, depth + 1, False))
+        return self._cached_ql  # type: ignore
 
     def prettify_query_string(self) -> str:
-        """Returns a prettified MeiliSearch query string representation of the Q object."""
-        query_string = self.to_query_string()
-        stack = []
+        """Returns a prettified MeiliSearch query string representation of the Q object.
+
+        Scans the rendered string once with a compiled token pattern
+        (parens, AND, 'OR ') instead of simulating a character stack and
+        re-joining its tail on every step; a newline plus the current
+        paren-depth indent follows each operator token.
+        """
+        if self._cached_pp is not None:
+            return self._cached_pp
         result = []
         indent = 0
         space = "    "
-
-        for char in query_string:
-            if char == "(":
-                stack.append(char)
+        for match in _PRETTIFY_TOKENS.finditer(self.to_query_string()):
+            token = match.group()
+            if token == "(":
                 indent += 1
-                result.append(char)
-            elif char == ")":
-                stack.pop()
+            elif token == ")":
                 indent -= 1
-                result.append(char)
-            elif char in ["A", "O"] and "".join(stack[-3:]) in ["AND", "OR "]:
-                result.append("\n" + indent * space + char)
-                stack.pop()
-            else:
-                stack.append(char)
-                result.append(char)
-
-            if len(stack) >= 3 and "".join(stack[-3:]) in ["AND", "OR "]:
+            result.append(token)
+            if token in ("AND", "OR "):
                 result.append("\n" + indent * space)
-
-        return "".join(result)
+        self._cached_pp = "".join(result)
+        return self._cached_pp
 
     def explain(self, indent_level: int = 0) -> str:
         """Returns a string representation of the Q object with
         indentation to show the nesting of the query."""
 
+        # Only the public top-level call is cached; nested calls carry a
+        # varying indent_level so their output is not reusable.
+        if indent_level == 0 and self._cached_ex is not None:
+            return self._cached_ex
+
         def indent(text: str, level: int) -> str:
             return "    " * level + text
 
         if self.operator:
-            left = self.children[0].explain(indent_level + 1)
-            right = self.children[1].explain(indent_level + 1)
-            return (
-                f"{indent('BEGIN', indent_level)}\n{left}"
-                + f"\n{indent(self.operator, indent_level)}\n{right}"
-            )
+            parts = [
+                child.explain(indent_level + 1) for child in self.children
+            ]
+            separator = f"\n{indent(self.operator, indent_level)}\n"
+            explanation = f"{indent('BEGIN', indent_level)}\n" + separator.join(parts)
+            if indent_level == 0:
+                self._cached_ex = explanation
+            return explanation
         conditions = []
-        for key, value in self.conditions.items():
-            *fields, operation = (
-                key.split("__") if "__" in key else (key, Q.OPERATIONS.EQUALS)
-            )
-            field = ".".join(fields)
-            if self.negate:
-                operation = self.negate_map[self.op_map[operation]]
-            else:
-                operation = self.op_map[operation]
+        for field, operation, value in self._parsed_conditions:
+            operation = (
+                self._NEGATED_OP_MAP if self.negate else self.op_map
+            )[operation]
             explanation = ""
             if operation == "EXISTS":
                 explanation = "exists"
@@ -289,4 +464,21 @@ class Q:
                     indent_level,
                 )
             )
-        return "\n".join(conditions)
+        explanation = "\n".join(conditions)
+        if indent_level == 0:
+            self._cached_ex = explanation
+        return explanation
+
+
+@lru_cache(maxsize=1024)
+def _parse_key(key: str) -> tuple:
+    """Split a condition keyword into its (field, operation) pair.
+
+    Condition keys repeat heavily across Q instances (the same
+    `age__gte`-style keywords appear in every request), so the split and
+    join are memoized module-wide rather than redone per render.
+    """
+    if "__" not in key:
+        return key, _OP_EQ
+    *fields, operation = key.split("__")
+    return ".".join(fields), intern(operation)
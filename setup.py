@@ -1,4 +1,6 @@
-# pylint: disable=missing-docstring, invalid-name, line-too-long, R1732
+# pylint: disable=missing-docstring, invalid-name, line-too-long
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
 setup(
@@ -9,7 +11,7 @@ setup(
     + " It simplifies search query building and offers a convenient wrapper"
     + " for MeiliSearch indexes and clients, streamlining search interactions"
     + " and improving maintainability.",
-    long_description=open("README.md", encoding="utf-8").read(),
+    long_description=(Path(__file__).parent / "README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     author="Adrian Leo",
     url="https://github.com/UnattendedFlight/meilisearch-dsl",
@@ -20,10 +22,14 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: Implementation :: CPython",
+        "Programming Language :: Python :: Implementation :: PyPy",
     ],
+    python_requires=">=3.9",
     install_requires=[
         # List your package's dependencies here
         "meilisearch==0.26.0",